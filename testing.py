@@ -6,8 +6,19 @@ A Comparative Analysis of Dijkstra’s and A Algorithms for Smart Flight Pathfin
 - Displays full VIA path and layover durations
 """
 
-import json, heapq, itertools
+import json, heapq
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from operator import itemgetter
+
+try:
+    import orjson  # optional, parses the flight cache several times faster
+except ImportError:
+    orjson = None
+
+EPOCH = datetime(1970, 1, 1)
+INF = float("inf")
+EDGE_DEP = itemgetter(1)
 
 # ----------------------------------
 # Airline mapping
@@ -25,16 +36,38 @@ DEFAULT_AIRLINE_NAMES = {
 # ----------------------------------
 # Helpers
 # ----------------------------------
-def get_dep_time(f):
+def parse_dep_time(f):
     d = f.get("departure") or f.get("dep") or f.get("from_time")
     if isinstance(d, dict): d = d.get("at")
     return datetime.fromisoformat(d)
 
-def get_arr_time(f):
+def parse_arr_time(f):
     a = f.get("arrival") or f.get("arr") or f.get("to_time")
     if isinstance(a, dict): a = a.get("at")
     return datetime.fromisoformat(a)
 
+def load_flights(path):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def prepare_flights(flights):
+    # Parse each flight's times once so the search loops only do dict lookups
+    # and integer arithmetic
+    for f in flights:
+        dep, arr = parse_dep_time(f), parse_arr_time(f)
+        f["_dep_dt"], f["_arr_dt"] = dep, arr
+        f["_dep_s"] = int((dep - EPOCH).total_seconds())
+        f["_arr_s"] = int((arr - EPOCH).total_seconds())
+        f["_dur_s"] = f["_arr_s"] - f["_dep_s"]
+        f["_date"] = dep.date()
+
+def get_dep_time(f):
+    return f["_dep_dt"]
+
+def get_arr_time(f):
+    return f["_arr_dt"]
+
 def travel_duration(dep, arr):
     secs = (arr - dep).total_seconds()
     h, m = divmod(int(secs // 60), 60)
@@ -45,20 +78,69 @@ def format_dur(secs):
     return f"{h}h {m}m"
 
 def airline_name(code, cache):
-    return cache.get(code) or DEFAULT_AIRLINE_NAMES.get(code, code)
+    return cache.get(code, code)
 
 # ----------------------------------
 # Build flight graph
 # ----------------------------------
 def build_graph(flights):
+    # Each edge packs the fields the search loops read, so expanding a node
+    # is a tuple unpack instead of a handful of dict lookups per neighbour
     g = {}
     for f in flights:
         a, b = f.get("from"), f.get("to")
         if not a or not b:
             continue
-        g.setdefault(a, []).append((b, f))
+        edges = g.setdefault(a, [])
+        edges.append((b, f["_dep_s"], f["_arr_s"], f["_bit"], f, len(edges)))
+    # Sorted by departure so a layover window is a bisect instead of a full scan;
+    # the trailing file position keeps heap ties in the original order
+    for edges in g.values():
+        edges.sort(key=EDGE_DEP)
     return g
 
+def build_graph_by_date(flights):
+    by_date = {}
+    for f in flights:
+        # Searches never span dates, so each flight's bit only has to be unique
+        # within its day; that keeps the used-flight masks small
+        flts = by_date.setdefault(f["_date"], [])
+        f["_bit"] = 1 << len(flts)
+        flts.append(f)
+    return {d: build_graph(flts) for d, flts in by_date.items()}
+
+def build_heuristic_table(g):
+    # Lower bound on travel time between every pair of airports: chain of the
+    # shortest single-flight durations (Floyd-Warshall). Layovers only add time,
+    # so this never overestimates and keeps A* admissible.
+    airports = set(g)
+    for edges in g.values():
+        airports.update(nxt for nxt, *_ in edges)
+    h = {a: {b: 0 if a == b else INF for b in airports} for a in airports}
+    for a, edges in g.items():
+        row = h[a]
+        for b, dep_s, arr_s, *_ in edges:
+            row[b] = min(row[b], arr_s - dep_s)
+    for k in airports:
+        row_k = h[k]
+        for a in airports:
+            row_a = h[a]
+            a_k = row_a[k]
+            if a_k == INF:
+                continue
+            for b in airports:
+                if a_k + row_k[b] < row_a[b]:
+                    row_a[b] = a_k + row_k[b]
+    return h
+
+def build_directs_by_pair(flights):
+    directs = {}
+    for f in flights:
+        directs.setdefault((f["_date"], f["from"], f["to"]), []).append(f)
+    for flts in directs.values():
+        flts.sort(key=lambda f: f["_dur_s"])
+    return directs
+
 # ----------------------------------
 # Display
 # ----------------------------------
@@ -96,21 +178,22 @@ def display_itinerary(segs, airline_cache):
 # ----------------------------------
 # Pathfinding (Dijkstra + A*)
 # ----------------------------------
-def heuristic(a, b):
-    return 0
-
-def find_connected(all_flights, start, end, date, max_legs=3, min_conn=30, max_conn=480, max_results=6):
-    flts = [f for f in all_flights if get_dep_time(f).date() == date]
-    g = build_graph(flts)
-    pq, results, counter = [], [], itertools.count()
-    for _, seg in g.get(start, []):
-        dep, arr = get_dep_time(seg), get_arr_time(seg)
-        cost = (arr - dep).total_seconds()
-        heapq.heappush(pq, (cost, next(counter), seg["to"], [seg]))
+def heuristic(h_table, a, b):
+    return h_table.get(a, {}).get(b, INF)
+
+def find_connected(g, start, end, max_legs=3, min_conn=30, max_conn=480, max_results=6):
+    # Ties break on (parent's pop number, edge file position): the same order a
+    # global push counter gives, without a counter call per push
+    pq, results, pops = [], [], 0
+    for nxt, dep_s, arr_s, bit, seg, pos in g.get(start, ()):
+        heapq.heappush(pq, (arr_s - dep_s, pops, pos, nxt, [seg], bit, (start,)))
     visited = set()
     while pq and len(results) < max_results:
-        total_sec, _, curr, path = heapq.heappop(pq)
-        state_key = (curr, tuple(s["from"] for s in path))
+        total_sec, _, _, curr, path, used_mask, route = heapq.heappop(pq)
+        pops += 1
+        # Airports visited so far; extended once per pop and shared by every
+        # child pushed below, rather than rebuilt from the path each time
+        state_key = route + (curr,)
         if state_key in visited:
             continue
         visited.add(state_key)
@@ -119,35 +202,36 @@ def find_connected(all_flights, start, end, date, max_legs=3, min_conn=30, max_c
             continue
         if len(path) >= max_legs:
             continue
-        last_arr = get_arr_time(path[-1])
-        for nxt, seg in g.get(curr, []):
-            if seg in path:
+        start_dep, last_arr = path[0]["_dep_s"], path[-1]["_arr_s"]
+        # A child on its final leg can only ever be popped and dropped unless it
+        # lands at the destination, so don't grow the heap with it
+        last_leg = len(path) + 1 >= max_legs
+        edges = g.get(curr, ())
+        lo = bisect_left(edges, last_arr + min_conn * 60, key=EDGE_DEP)
+        hi = bisect_right(edges, last_arr + max_conn * 60, key=EDGE_DEP)
+        for nxt, dep_s, arr_s, bit, seg, pos in edges[lo:hi]:
+            if used_mask & bit or (last_leg and nxt != end):
                 continue
-            dep, arr = get_dep_time(seg), get_arr_time(seg)
-            layover_min = (dep - last_arr).total_seconds() / 60
-            if layover_min < min_conn or layover_min > max_conn:
-                continue
-            new_total = (arr - get_dep_time(path[0])).total_seconds() + heuristic(seg["to"], end)
-            heapq.heappush(pq, (new_total, next(counter), seg["to"], path + [seg]))
+            new_total = arr_s - start_dep
+            heapq.heappush(pq, (new_total, pops, pos, nxt, path + [seg], used_mask | bit, state_key))
     return sorted(results, key=lambda x: x[0])
 
-def find_direct(all_flights, start, end, date):
-    directs = [f for f in all_flights if f["from"] == start and f["to"] == end and get_dep_time(f).date() == date]
-    return sorted(directs, key=lambda f: (get_arr_time(f) - get_dep_time(f)).total_seconds())
+def find_direct(directs_by_pair, start, end, date):
+    return directs_by_pair.get((date, start, end), [])
 
-def best_a_star(all_flights, start, end, date, connected=False):
-    flts = [f for f in all_flights if get_dep_time(f).date() == date]
-    g = build_graph(flts)
-    pq, counter = [], itertools.count()
+def best_a_star(g, h_table, start, end, connected=False):
+    pq, pops = [], 0
     if connected:
-        for _, seg in g.get(start, []):
-            dep, arr = get_dep_time(seg), get_arr_time(seg)
-            heapq.heappush(pq, ((arr - dep).total_seconds() + heuristic(seg["to"], end),
-                                next(counter), seg["to"], [seg]))
-        visited = set()
+        for nxt, dep_s, arr_s, bit, seg, pos in g.get(start, ()):
+            h = heuristic(h_table, nxt, end)
+            if h == INF:
+                continue
+            heapq.heappush(pq, (arr_s - dep_s + h, pops, pos, nxt, [seg], bit, (start,)))
+        visited, fewest_legs = set(), {}
         while pq:
-            total, _, curr, path = heapq.heappop(pq)
-            state_key = (curr, tuple(s["from"] for s in path))
+            total, _, _, curr, path, used_mask, route = heapq.heappop(pq)
+            pops += 1
+            state_key = route + (curr,)
             if state_key in visited:
                 continue
             visited.add(state_key)
@@ -155,20 +239,30 @@ def best_a_star(all_flights, start, end, date, connected=False):
                 return path
             if len(path) >= 3:
                 continue
-            last_arr = get_arr_time(path[-1])
-            for nxt, seg in g.get(curr, []):
-                if seg in path:
+            start_dep, last_arr = path[0]["_dep_s"], path[-1]["_arr_s"]
+            # An earlier pop at this airport with the same arrival had a cost no
+            # higher and the same onward connections; only expand if we used fewer legs
+            dom_key = (curr, last_arr)
+            if fewest_legs.get(dom_key, INF) <= len(path):
+                continue
+            fewest_legs[dom_key] = len(path)
+            last_leg = len(path) + 1 >= 3
+            edges = g.get(curr, ())
+            lo = bisect_left(edges, last_arr + 30 * 60, key=EDGE_DEP)
+            hi = bisect_right(edges, last_arr + 480 * 60, key=EDGE_DEP)
+            for nxt, dep_s, arr_s, bit, seg, pos in edges[lo:hi]:
+                if used_mask & bit or (last_leg and nxt != end):
                     continue
-                dep, arr = get_dep_time(seg), get_arr_time(seg)
-                layover_min = (dep - last_arr).total_seconds() / 60
-                if layover_min < 30 or layover_min > 480:
+                h = heuristic(h_table, nxt, end)
+                if h == INF:
                     continue
-                heapq.heappush(pq, ((arr - get_dep_time(path[0])).total_seconds() + heuristic(seg["to"], end),
-                                    next(counter), seg["to"], path + [seg]))
+                heapq.heappush(pq, (arr_s - start_dep + h,
+                                    pops, pos, nxt, path + [seg], used_mask | bit, state_key))
         return None
     else:
-        directs = find_direct(all_flights, start, end, date)
-        return directs[0] if directs else None
+        best = min(((arr_s - dep_s, pos, seg) for nxt, dep_s, arr_s, _, seg, pos in g.get(start, ())
+                    if nxt == end), default=None)
+        return best[2] if best else None
 
 # ----------------------------------
 # Input validation with retry
@@ -194,31 +288,35 @@ def get_valid_date(prompt):
 # ----------------------------------
 if __name__ == "__main__":
     cache_path = r"C:\Users\jashn\OneDrive\Desktop\Project\flights_cache.json"
-    with open(cache_path, "r", encoding="utf-8") as f:
-        all_flights = json.load(f)
-
-    airline_cache = {}
-    all_airports = set()
-    for f in all_flights:
-        c = f.get("carrier") or f.get("marketingCarrier")
-        if c and f.get("airline"):
-            airline_cache[c] = f["airline"]
-        all_airports.add(f["from"])
-        all_airports.add(f["to"])
+    all_flights = load_flights(cache_path)
+    prepare_flights(all_flights)
+    graphs_by_date = build_graph_by_date(all_flights)
+    directs_by_pair = build_directs_by_pair(all_flights)
+
+    # Defaults merged in up front so each displayed segment is a single lookup;
+    # names found in the cache still take priority
+    airline_cache = dict(DEFAULT_AIRLINE_NAMES)
+    airline_cache.update((c, f["airline"]) for f in all_flights
+                         if (c := f.get("carrier") or f.get("marketingCarrier")) and f.get("airline"))
+    all_airports = {f["from"] for f in all_flights} | {f["to"] for f in all_flights}
 
     start = get_valid_iata("From (IATA): ", all_airports)
     end = get_valid_iata("To (IATA): ", all_airports)
     date = get_valid_date("Date (YYYY-MM-DD): ")
 
+    # One day's graph feeds Dijkstra, A* and the heuristic table alike
+    g = graphs_by_date.get(date, {})
+    h_table = build_heuristic_table(g)
+
     allow_conn = input("Do you want connecting flights? (Y/N): ").upper()
 
     if allow_conn == "Y":
-        results = find_connected(all_flights, start, end, date)
+        results = find_connected(g, start, end)
         if results:
             print("\n🏆 BEST CONNECTED OPTION (DIJKSTRA):")
             display_itinerary(results[0][1], airline_cache)
 
-            a_star_best = best_a_star(all_flights, start, end, date, connected=True)
+            a_star_best = best_a_star(g, h_table, start, end, connected=True)
             if a_star_best:
                 print("⭐ BEST CONNECTED OPTION (A*):")
                 display_itinerary(a_star_best, airline_cache)
@@ -230,12 +328,12 @@ if __name__ == "__main__":
         else:
             print("❌ No connected routes found.")
     else:
-        directs = find_direct(all_flights, start, end, date)
+        directs = find_direct(directs_by_pair, start, end, date)
         if directs:
             print("\n🏆 BEST DIRECT OPTION (DIJKSTRA):")
             display_itinerary([directs[0]], airline_cache)
 
-            a_star_best = best_a_star(all_flights, start, end, date, connected=False)
+            a_star_best = best_a_star(g, h_table, start, end, connected=False)
             if a_star_best:
                 print("⭐ BEST DIRECT OPTION (A*):")
                 display_itinerary([a_star_best], airline_cache)